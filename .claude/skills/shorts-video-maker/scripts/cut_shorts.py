@@ -10,9 +10,19 @@ import os
 import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# 서브프로세스 타임아웃 (초) - 행이 걸린 ffmpeg/ffprobe가 파이프라인을 막지 않도록
+PROBE_TIMEOUT = 30
+ENCODE_TIMEOUT = 600
+
+# "참조 구간: 시작시간 - 종료시간" 패턴 (모듈 로드 시 1회 컴파일)
+TIME_RANGE_RE = re.compile(
+    r"참조\s*구간\s*:\s*(\d+:?\d*\.?\d*)\s*-\s*(\d+:?\d*\.?\d*)"
+)
+
 
 def parse_time(time_str: str) -> float:
     """
@@ -58,11 +68,18 @@ def get_video_dimensions(video_path: str) -> Tuple[int, int]:
     ]
 
     try:
-        result = subprocess.run(cmd, capture_output=True, check=True)
+        result = subprocess.run(
+            cmd, capture_output=True, check=True, timeout=PROBE_TIMEOUT
+        )
         data = json.loads(result.stdout)
         stream = data["streams"][0]
         return stream["width"], stream["height"]
-    except (subprocess.CalledProcessError, json.JSONDecodeError, KeyError) as e:
+    except (
+        subprocess.CalledProcessError,
+        subprocess.TimeoutExpired,
+        json.JSONDecodeError,
+        KeyError,
+    ) as e:
         print(f"❌ 영상 정보 추출 실패: {e}")
         sys.exit(1)
 
@@ -173,12 +190,15 @@ def extract_clip(
 
     try:
         print(f"   ⏳ 클립 추출 중: {start_time:.1f}s - {end_time:.1f}s")
-        subprocess.run(cmd, check=True, capture_output=True)
+        subprocess.run(cmd, check=True, capture_output=True, timeout=ENCODE_TIMEOUT)
         print(f"   ✅ 완료: {output_path}")
         return output_path
     except subprocess.CalledProcessError as e:
         print(f"   ❌ 클립 추출 실패: {e.stderr.decode()}")
         return None
+    except subprocess.TimeoutExpired:
+        print(f"   ❌ 클립 추출 시간 초과 ({ENCODE_TIMEOUT}초): {output_path}")
+        return None
 
 
 def parse_script_file(script_path: str) -> Optional[Dict]:
@@ -198,8 +218,7 @@ def parse_script_file(script_path: str) -> Optional[Dict]:
         content = f.read()
 
     # "참조 구간: 시작시간 - 종료시간" 패턴 찾기
-    pattern = r"참조\s*구간\s*:\s*(\d+:?\d*\.?\d*)\s*-\s*(\d+:?\d*\.?\d*)"
-    match = re.search(pattern, content)
+    match = TIME_RANGE_RE.search(content)
 
     if match:
         return {
@@ -362,13 +381,12 @@ def main():
     for clip in clips:
         print(f"   [{clip['index']}] {clip['start']:.1f}s - {clip['end']:.1f}s")
 
-    # 클립 추출
+    # 클립 추출 (ffmpeg 인코딩을 클립별로 병렬 실행)
     print("\n" + "-" * 50)
-    results = []
 
-    for clip in clips:
+    def run_clip(clip: Dict) -> Optional[str]:
         output_file = output_path / f"shorts-{clip['index']:02d}.mp4"
-        result = extract_clip(
+        return extract_clip(
             args.input,
             str(output_file),
             clip["start"],
@@ -376,8 +394,9 @@ def main():
             crop,
             args.subtitle,
         )
-        if result:
-            results.append(result)
+
+    with ThreadPoolExecutor(max_workers=min(3, len(clips))) as executor:
+        results = [r for r in executor.map(run_clip, clips) if r]
 
     print("-" * 50)
     print(f"\n✅ 쇼츠 클립 {len(results)}개 생성 완료!")
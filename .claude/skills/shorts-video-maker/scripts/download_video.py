@@ -17,7 +17,12 @@ except ImportError:
     sys.exit(1)
 
 
-def download_video(url: str, output_dir: str, filename: str = "video") -> str:
+def download_video(
+    url: str,
+    output_dir: str,
+    filename: str = "video",
+    audio_only: bool = False,
+) -> str:
     """
     YouTube 영상을 다운로드합니다.
 
@@ -25,6 +30,7 @@ def download_video(url: str, output_dir: str, filename: str = "video") -> str:
         url: YouTube 영상 URL
         output_dir: 저장할 디렉토리 경로
         filename: 저장할 파일명 (확장자 제외)
+        audio_only: 오디오만 다운로드 (자막 추출용, 용량 5-20배 절약)
 
     Returns:
         다운로드된 파일의 전체 경로
@@ -59,8 +65,16 @@ def download_video(url: str, output_dir: str, filename: str = "video") -> str:
         # 재시도 설정
         "retries": 3,
         "fragment_retries": 3,
+        # 느린 CDN에서 무한 대기하지 않도록 소켓 타임아웃 설정
+        "socket_timeout": 30,
     }
 
+    # 오디오 전용 모드 (Whisper 자막 추출에는 영상 트랙이 필요 없음)
+    if audio_only:
+        ydl_opts["format"] = "bestaudio[ext=m4a]/bestaudio"
+        ydl_opts["writethumbnail"] = False
+        del ydl_opts["merge_output_format"]
+
     print(f"다운로드 시작: {url}")
     print(f"저장 위치: {output_path}")
     print("-" * 50)
@@ -70,8 +84,15 @@ def download_video(url: str, output_dir: str, filename: str = "video") -> str:
             # 영상 정보 추출
             info = ydl.extract_info(url, download=True)
 
-            # 다운로드된 파일 경로
-            downloaded_file = str(output_path / f"{filename}.mp4")
+            # 다운로드된 파일 경로 (yt-dlp가 보고한 실제 경로 사용)
+            downloaded_file = None
+            for download in info.get("requested_downloads") or []:
+                if download.get("filepath"):
+                    downloaded_file = download["filepath"]
+                    break
+            if not downloaded_file:
+                ext = "m4a" if audio_only else "mp4"
+                downloaded_file = str(output_path / f"{filename}.{ext}")
 
             print("-" * 50)
             print(f"✅ 다운로드 완료!")
@@ -108,6 +129,7 @@ def main():
 예시:
   python download_video.py --url "https://youtube.com/watch?v=xxxxx" --output "./temp"
   python download_video.py -u "https://youtu.be/xxxxx" -o "./temp" -f "my_video"
+  python download_video.py -u "https://youtu.be/xxxxx" -o "./temp" --audio-only
         """,
     )
 
@@ -120,6 +142,10 @@ def main():
     parser.add_argument(
         "--filename", "-f", default="video", help="저장할 파일명 (기본값: video)"
     )
+    parser.add_argument(
+        "--audio-only", "-a", action="store_true",
+        help="오디오만 다운로드 (자막 추출 전용, 다운로드 용량 절약)"
+    )
 
     args = parser.parse_args()
 
@@ -131,7 +157,9 @@ def main():
             sys.exit(0)
 
     # 다운로드 실행
-    downloaded_path = download_video(args.url, args.output, args.filename)
+    downloaded_path = download_video(
+        args.url, args.output, args.filename, args.audio_only
+    )
 
     return downloaded_path
 
@@ -5,14 +5,15 @@ OpenAI Whisper를 사용하여 영상에서 음성을 텍스트로 변환합니
 """
 
 import argparse
+import functools
 import json
 import os
-import subprocess
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
 try:
+    import torch
     import whisper
 except ImportError:
     print("Error: whisper가 설치되지 않았습니다.")
@@ -20,54 +21,33 @@ except ImportError:
     sys.exit(1)
 
 
-def extract_audio(video_path: str, audio_path: str) -> str:
+@functools.lru_cache(maxsize=2)
+def load_model(model_name: str):
     """
-    영상에서 오디오를 추출합니다.
+    Whisper 모델을 로드합니다. (같은 모델은 한 번만 로드하여 재사용)
 
     Args:
-        video_path: 입력 영상 파일 경로
-        audio_path: 출력 오디오 파일 경로
+        model_name: Whisper 모델 이름
 
     Returns:
-        추출된 오디오 파일 경로
+        로드된 Whisper 모델
     """
-    print(f"🎵 오디오 추출 중: {video_path}")
-
-    # ffmpeg 명령어
-    cmd = [
-        "ffmpeg",
-        "-i", video_path,
-        "-vn",  # 비디오 제외
-        "-acodec", "pcm_s16le",  # PCM 16-bit
-        "-ar", "16000",  # 16kHz 샘플레이트 (Whisper 권장)
-        "-ac", "1",  # 모노
-        "-y",  # 덮어쓰기
-        audio_path,
-    ]
-
-    try:
-        subprocess.run(cmd, check=True, capture_output=True)
-        print(f"   ✅ 오디오 추출 완료: {audio_path}")
-        return audio_path
-    except subprocess.CalledProcessError as e:
-        print(f"   ❌ 오디오 추출 실패: {e.stderr.decode()}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print("   ❌ ffmpeg가 설치되지 않았습니다.")
-        print("   설치: brew install ffmpeg (macOS) 또는 apt-get install ffmpeg (Ubuntu)")
-        sys.exit(1)
+    return whisper.load_model(model_name)
 
 
 def transcribe_audio(
-    audio_path: str,
+    media_path: str,
     model_name: str = "base",
     language: str = "ko",
 ) -> Dict:
     """
-    오디오를 텍스트로 변환합니다.
+    영상/오디오를 텍스트로 변환합니다.
+
+    Whisper가 내부에서 ffmpeg로 16kHz 모노 디코딩을 1회 수행하므로
+    별도의 오디오 추출 단계가 필요 없습니다.
 
     Args:
-        audio_path: 오디오 파일 경로
+        media_path: 영상 또는 오디오 파일 경로
         model_name: Whisper 모델 이름 (tiny, base, small, medium, large)
         language: 언어 코드
 
@@ -77,17 +57,18 @@ def transcribe_audio(
     print(f"🎤 음성 인식 중... (모델: {model_name})")
     print("   ⏳ 모델 로딩 중 (처음 실행 시 다운로드됨)...")
 
-    # 모델 로드
-    model = whisper.load_model(model_name)
+    # 모델 로드 (캐시되어 재호출 시 즉시 반환)
+    model = load_model(model_name)
     print(f"   ✅ 모델 로드 완료")
 
     # 음성 인식 실행
     print("   🔊 음성 인식 진행 중...")
     result = model.transcribe(
-        audio_path,
+        media_path,
         language=language,
         verbose=False,
         word_timestamps=True,  # 단어별 타임스탬프
+        fp16=torch.cuda.is_available(),  # GPU에서만 FP16 (CPU는 FP32가 더 빠름)
     )
 
     print(f"   ✅ 음성 인식 완료")
@@ -243,29 +224,20 @@ def main():
     print("🎬 영상 음성 인식 시작")
     print("=" * 50)
 
-    # 1. 오디오 추출
-    audio_path = args.input.rsplit(".", 1)[0] + "_audio.wav"
-    extract_audio(args.input, audio_path)
+    # 1. 음성 인식 (오디오 디코딩은 Whisper 내부에서 1회 수행)
+    result = transcribe_audio(args.input, args.model, args.language)
 
-    # 2. 음성 인식
-    result = transcribe_audio(audio_path, args.model, args.language)
-
-    # 3. 결과 포맷팅
+    # 2. 결과 포맷팅
     transcript = format_transcript(result)
 
-    # 4. JSON 저장
+    # 3. JSON 저장
     save_transcript(transcript, args.output)
 
-    # 5. SRT 저장 (옵션)
+    # 4. SRT 저장 (옵션)
     if args.srt:
         srt_path = args.output.rsplit(".", 1)[0] + ".srt"
         generate_srt(transcript, srt_path)
 
-    # 6. 임시 오디오 파일 정리
-    if os.path.exists(audio_path):
-        os.remove(audio_path)
-        print(f"🧹 임시 파일 정리: {audio_path}")
-
     print("=" * 50)
     print("✅ 음성 인식 완료!")
     print(f"   전체 길이: {transcript['duration']}초")